@@ -1,17 +1,19 @@
 """Module for loading and accessing configuration settings."""
 
 import configparser
+import dataclasses
 import pathlib
 import logging
 
 # Configuration for logging
 CONFIG_FILE_PATH = (
-    pathlib.Path(__file__).resolve().parent.parent.parent 
-    / "config" 
+    pathlib.Path(__file__).resolve().parent.parent.parent
+    / "config"
     / "config.cfg"
 )
-# Initialize the config parser
-config = configparser.ConfigParser()
+# Initialize the config parser; config.cfg annotates values with inline
+# "#" comments, so they must be stripped before type coercion
+config = configparser.ConfigParser(inline_comment_prefixes=("#",))
 # Read the configuration file
 if not CONFIG_FILE_PATH.exists():
     logging.critical(f"Configuration file not found at: {CONFIG_FILE_PATH}")
@@ -31,6 +33,43 @@ else:
         raise
 
 
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    """Immutable, typed snapshot of the configuration file.
+
+    The file is parsed and coerced exactly once at import; accessing a
+    setting afterwards is a plain attribute read instead of a
+    configparser lookup and string conversion per call.
+    """
+
+    chroma_db: pathlib.Path
+    sqlite_db: pathlib.Path
+    llm_model: pathlib.Path
+    embedding_model: pathlib.Path
+    collection_name: str
+    n_ctx: int
+    n_threads: int
+    similarity_k: int
+    log_level: str
+    timeout: int
+    min_content_length: int
+
+
+SETTINGS = Settings(
+    chroma_db=pathlib.Path(config.get('Paths', 'chroma_db')),
+    sqlite_db=pathlib.Path(config.get('Paths', 'sqlite_db')),
+    llm_model=pathlib.Path(config.get('Paths', 'llm_model')),
+    embedding_model=pathlib.Path(config.get('Paths', 'embedding_model')),
+    collection_name=config.get('ChromaDB', 'collection_name'),
+    n_ctx=config.getint('Models', 'n_ctx'),
+    n_threads=config.getint('Models', 'n_threads'),
+    similarity_k=config.getint('RAG', 'similarity_k'),
+    log_level=config.get('Logging', 'level', fallback='INFO').upper(),
+    timeout=config.getint('Scraping', 'timeout'),
+    min_content_length=config.getint('Scraping', 'min_content_length'),
+)
+
+
 def get_path(key: str) -> str:
     """Retrieve a path from the [Paths] section.
 
@@ -42,7 +81,7 @@ def get_path(key: str) -> str:
     -------
         - str: The path associated with the key.
     """
-    return config.get('Paths', key)
+    return str(getattr(SETTINGS, key))
 
 
 def get_chromadb_config(key: str) -> str:
@@ -56,53 +95,41 @@ def get_chromadb_config(key: str) -> str:
     -------
         - str: The configuration value associated with the key.
     """
-    return config.get('ChromaDB', key)
+    return getattr(SETTINGS, key)
 
 
 def get_model_param(key: str, type_func=int):
     """Retrieve a model parameter from the [Models] section.
 
-    Also handles type conversion.
-
     Parameters:
     ----------
         - key (str): The key for the model parameter to retrieve.
-        - type_func (type): The type to convert the value to (default is int).
+        - type_func (type): Unused; kept for backward compatibility. The
+          value is already coerced in SETTINGS.
 
     Returns:
     -------
         - int/float/bool/str: The model parameter value associated with the
-          key,converted to the specified type.
+          key.
     """
-    if type_func == int:
-        return config.getint('Models', key)
-    elif type_func == float:
-        return config.getfloat('Models', key)
-    elif type_func == bool:
-        return config.getboolean('Models', key)
-    else:
-        return config.get('Models', key)
+    return getattr(SETTINGS, key)
 
 
 def get_rag_param(key: str, type_func=int):
     """Retrieve a RAG parameter from the [RAG] section.
 
-    Also handles type conversion.
-
     Parameters:
     ----------
         - key (str): The key for the RAG parameter to retrieve.
-        - type_func (type): The type to convert the value to (default is int).
+        - type_func (type): Unused; kept for backward compatibility. The
+          value is already coerced in SETTINGS.
 
     Returns:
     -------
-        - int/float/bool/str: The RAG parameter value associated with the key,
-          converted to the specified type.
+        - int/float/bool/str: The RAG parameter value associated with the
+          key.
     """
-    if type_func == int:
-        return config.getint('RAG', key)
-    else:
-        return config.get('RAG', key)
+    return getattr(SETTINGS, key)
 
 
 def get_logging_level() -> str:
@@ -113,34 +140,30 @@ def get_logging_level() -> str:
         - str: The logging level as a string (e.g., 'DEBUG', 'INFO',
           'WARNING', etc.).
     """
-    return config.get('Logging', 'level', fallback='INFO').upper()
+    return SETTINGS.log_level
 
 
 def get_scraping_param(key: str, type_func=int):
     """Retrieve a scraping parameter from the [Scraping] section.
 
-    Also handles type conversion.
-
     Parameters:
     ----------
         - key (str): The key for the scraping parameter to retrieve.
-        - type_func (type): The type to convert the value to (default is int).
+        - type_func (type): Unused; kept for backward compatibility. The
+          value is already coerced in SETTINGS.
 
     Returns:
     -------
-        - int/float/bool/str: The scraping parameter value associated with the
-          key, converted to the specified type.
+        - int/float/bool/str: The scraping parameter value associated with
+          the key.
     """
-    if type_func == int:
-        return config.getint('Scraping', key)
-    else:
-        return config.get('Scraping', key)
+    return getattr(SETTINGS, key)
 
 
 if __name__ == "__main__":
     # Example usage in this module (for testing)
-    print(f"LLM Model Path: {get_path('llm_model')}")
-    print(f"Chroma Collection: {get_chromadb_config('collection_name')}")
-    print(f"LLM n_ctx: {get_model_param('n_ctx')}")
-    print(f"RAG K: {get_rag_param('similarity_k')}")
-    print(f"Logging Level: {get_logging_level()}")
+    print(f"LLM Model Path: {SETTINGS.llm_model}")
+    print(f"Chroma Collection: {SETTINGS.collection_name}")
+    print(f"LLM n_ctx: {SETTINGS.n_ctx}")
+    print(f"RAG K: {SETTINGS.similarity_k}")
+    print(f"Logging Level: {SETTINGS.log_level}")
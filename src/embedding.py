@@ -1,11 +1,9 @@
 """Module to get the embedding function for the Ollama model."""
 
 import logging
-from logging_configuration import setup_logging
 from langchain_community.embeddings import LlamaCppEmbeddings
 
-# Configuration for logging
-setup_logging()
+# Module logger (logging is configured by the entry points)
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +22,7 @@ def get_embedding_function(model_path: str) -> LlamaCppEmbeddings:
     try:
         embeddings = LlamaCppEmbeddings(
             model_path=model_path,
+            n_batch=512,  # Large batches amortize model-eval overhead
             verbose=False
         )
         logger.info("Embeddings function initialized successfully.")
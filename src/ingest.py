@@ -1,10 +1,13 @@
 """Ingest URLs and update the Chroma database with new chunks."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from langchain.schema import Document
 from langchain_chroma import Chroma
+from langchain_community.embeddings import LlamaCppEmbeddings
 from embedding import get_embedding_function
 from chunker import calculate_chunk_ids, chunk_document
+import json
 import sqlite3
 from web_scraping import fetch_content
 import logging
@@ -12,8 +15,7 @@ from logging_configuration import setup_logging
 import pathlib
 from config_loader import get_path, get_chromadb_config
 
-# Configuration for logging
-setup_logging()
+# Module logger (logging is configured by the entry points)
 logger = logging.getLogger(__name__)
 
 # Project root directory
@@ -32,6 +34,11 @@ logger.info(f"Chroma DB path set to: {CHROMA_DB_PATH}")
 logger.info(f"Embedding model path set to: {EMBEDDING_MODEL_PATH}")
 logger.info(f"Chroma collection name: {COLLECTION_NAME}")
 
+# Maximum number of IDs to look up in Chroma per request
+ID_LOOKUP_BATCH_SIZE = 1000
+# Number of worker threads for concurrent URL fetching
+FETCH_WORKERS = 16
+
 
 def db_exists() -> bool:
     """Check if the database file exists.
@@ -57,31 +64,36 @@ def get_pending_urls(con: sqlite3.Connection) -> list[tuple[str, str]]:
     """
     cur = con.cursor()
     cur.execute("SELECT url, published FROM urls WHERE ingested = 0")
-    logger.info(f"Fetching pending URLs from the database.")
+    logger.info("Fetching pending URLs from the database.")
     return cur.fetchall()
 
 
 def mark_urls_as_ingested(con: sqlite3.Connection, urls: list[str]):
     """Mark the given URLs as ingested in the database.
 
+    All URLs are updated with one statement via json_each; the commit is
+    left to the pipeline's connection context so the whole run is one
+    transaction.
+
     Parameters:
     ----------
         - con (sqlite3.Connection): SQLite connection object.
         - urls (list[str]): List of URLs to mark as ingested.
     """
-    cur = con.cursor()
-    cur.executemany(
-        "UPDATE urls SET ingested = 1 WHERE url = ?", [(url,) for url in urls]
+    con.execute(
+        "UPDATE urls SET ingested = 1 "
+        "WHERE url IN (SELECT value FROM json_each(?))",
+        (json.dumps(urls),)
     )
-    con.commit()
 
 
-def initialize_chroma_db() -> Chroma:
+def initialize_chroma_db() -> tuple[Chroma, LlamaCppEmbeddings]:
     """Initialize the Chroma database.
 
     Returns:
     -------
-        - Chroma: The initialized Chroma database object.
+        - tuple[Chroma, LlamaCppEmbeddings]: The initialized Chroma database
+          object and the embedding function it uses.
     """
     embedding_func = get_embedding_function(str(EMBEDDING_MODEL_PATH))
     chroma = Chroma(
@@ -90,12 +102,16 @@ def initialize_chroma_db() -> Chroma:
         collection_name=COLLECTION_NAME,
     )
     logger.info(f"Chroma DB initialized at `{CHROMA_DB_PATH}`")
-    return chroma
+    return chroma, embedding_func
 
 
 def filter_new_chunks(db: Chroma, chunks: list[Document]) -> list[Document]:
     """Filter out chunks that already exist in the Chroma database.
 
+    Only the candidate IDs are looked up in Chroma (in batches), so the
+    cost of deduplication scales with the ingest batch rather than with
+    the size of the whole collection.
+
     Parameters:
     ----------
         - db (Chroma): The Chroma database object.
@@ -107,9 +123,12 @@ def filter_new_chunks(db: Chroma, chunks: list[Document]) -> list[Document]:
           the database.
     """
     chunks_with_ids = calculate_chunk_ids(chunks)
-    existing_chunks = db.get(include=[])
-    existing_ids = set(existing_chunks["ids"])
-    logger.info(f"Existing chunk IDs: {len(existing_ids)}")
+    candidate_ids = [chunk.metadata["id"] for chunk in chunks_with_ids]
+    existing_ids = set()
+    for start in range(0, len(candidate_ids), ID_LOOKUP_BATCH_SIZE):
+        batch = candidate_ids[start:start + ID_LOOKUP_BATCH_SIZE]
+        existing_ids.update(db.get(ids=batch, include=[])["ids"])
+    logger.info("Existing chunk IDs: %d", len(existing_ids))
     new_chunks = []
     for chunk in chunks_with_ids:
         if chunk.metadata["id"] not in existing_ids:
@@ -117,19 +136,52 @@ def filter_new_chunks(db: Chroma, chunks: list[Document]) -> list[Document]:
     return new_chunks
 
 
-def add_chunks_to_chroma(db: Chroma, chunks: list[Document]):
+def add_chunks_to_chroma(
+    db: Chroma,
+    embedding_func: LlamaCppEmbeddings,
+    chunks: list[Document]
+):
     """Add new chunks to the Chroma database.
 
+    All chunk texts are embedded in a single embed_documents call so
+    llama.cpp evaluates them as one batch, then the precomputed vectors
+    are handed straight to the Chroma collection instead of letting
+    add_documents embed them one by one. Chunks with identical text
+    (shared boilerplate such as navigation or footers produces them under
+    different source IDs) are embedded once and the vector is reused.
+
     Parameters:
     ----------
         - db (Chroma): The Chroma database object.
+        - embedding_func (LlamaCppEmbeddings): The embedding function used
+          by the database.
         - chunks (list[Document]): List of Document objects to add to the
           database.
     """
     if chunks:
-        logger.info(f"Adding {len(chunks)} new chunks to Chroma DB.")
-        new_chunk_ids = [chunk.metadata["id"] for chunk in chunks]
-        db.add_documents(chunks, ids=new_chunk_ids)
+        logger.info("Adding %d new chunks to Chroma DB.", len(chunks))
+        texts = [chunk.page_content for chunk in chunks]
+        metadatas = [chunk.metadata for chunk in chunks]
+        new_chunk_ids = [metadata["id"] for metadata in metadatas]
+        # Map each distinct text to one slot in the embedding batch
+        unique_index = {}
+        for text in texts:
+            if text not in unique_index:
+                unique_index[text] = len(unique_index)
+        unique_texts = list(unique_index)
+        if len(unique_texts) < len(texts):
+            logger.info(
+                "Embedding %d unique texts for %d chunks.",
+                len(unique_texts), len(texts)
+            )
+        unique_vectors = embedding_func.embed_documents(unique_texts)
+        vectors = [unique_vectors[unique_index[text]] for text in texts]
+        db._collection.add(
+            ids=new_chunk_ids,
+            documents=texts,
+            embeddings=vectors,
+            metadatas=metadatas,
+        )
     else:
         logger.info("No new chunks to add to Chroma DB.")
 
@@ -139,6 +191,10 @@ def process_urls(
 ) -> tuple[list[Document], list[str]]:
     """Fetch content for URLs and return documents and successfully ingested.
 
+    URLs are fetched concurrently with a thread pool since each fetch is
+    dominated by network latency; downstream chunking does not depend on
+    the order of the documents.
+
     Parameters:
     ----------
         - urls (list[tuple[str, str]]): List of tuples containing URLs
@@ -150,12 +206,17 @@ def process_urls(
           objects and a list of successfully ingested URLs.
     """
     docs, ingested_urls = [], []
-    for url, _ in urls:
-        try:
-            docs.append(fetch_content(url))
-            ingested_urls.append(url)
-        except Exception as e:
-            logger.error(f"Error fetching URL {url}: {e}")
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        future_to_url = {
+            executor.submit(fetch_content, url): url for url, _ in urls
+        }
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                docs.append(future.result())
+                ingested_urls.append(url)
+            except Exception as e:
+                logger.error("Error fetching URL %s: %s", url, e)
     return docs, ingested_urls
 
 
@@ -176,9 +237,9 @@ def run_pipeline():
             logger.info("No documents fetched.")
             return
 
-        db = initialize_chroma_db()
+        db, embedding_func = initialize_chroma_db()
         new_chunks = filter_new_chunks(db, chunk_document(docs))
-        add_chunks_to_chroma(db, new_chunks)
+        add_chunks_to_chroma(db, embedding_func, new_chunks)
         mark_urls_as_ingested(con, ingested_urls)
         logger.info(
             f"Pipeline completed. Chroma DB saved at `{CHROMA_DB_PATH}`"
@@ -186,4 +247,5 @@ def run_pipeline():
 
 
 if __name__ == "__main__":
+    setup_logging()
     run_pipeline()
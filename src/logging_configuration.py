@@ -3,16 +3,26 @@
 import logging
 import sys
 
+# Set once by setup_logging so repeated calls do not rebuild handlers
+_CONFIGURED = False
+
 
 def setup_logging(level=logging.INFO):
     """Configures the root logger explicitly, removing existing handlers.
 
+    The configuration is applied once per process; subsequent calls are
+    no-ops so importing several modules does not churn handler state.
+
     Parameters:
     ----------
         level : int
             The logging level to set for the root logger
             (default is logging.INFO).
     """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     # Delete existing handlers if any
@@ -1,6 +1,8 @@
 """This script implements a local RAG pipeline using Llama and Chroma."""
 
 import argparse
+import functools
+import sys
 from embedding import get_embedding_function
 from langchain_chroma import Chroma
 import llama_cpp
@@ -12,8 +14,7 @@ import pathlib
 from config_loader import get_rag_param
 from config_loader import get_path
 
-# Configuration for logging
-setup_logging()
+# Module logger (logging is configured by the entry points)
 logger = logging.getLogger(__name__)
 
 # Project root directory
@@ -37,10 +38,16 @@ logger.info(f"Chroma collection name: {COLLECTION_NAME}")
 logger.info(f"LLM n_ctx: {n_ctx}, n_threads: {n_threads}")
 logger.info(f"RAG similarity k: {similarity_k}")
 
-# Prompt template for the Llama model
-PROMPT_TEMPLATE = (
-    "Answer the following question: {question} based only on the following"
-    "context:\n{context}\n\n"
+# Flush streamed output to the terminal every N tokens
+STREAM_FLUSH_INTERVAL = 16
+
+# Prompt template for the Llama model, pre-split around the question and
+# context slots so building a prompt is plain concatenation; this also
+# keeps braces in user questions from being interpreted by str.format
+PROMPT_PREFIX = "Answer the following question: "
+PROMPT_MIDDLE = " based only on the followingcontext:\n"
+PROMPT_SUFFIX = (
+    "\n\n"
     "---\n"
     "Give me only the answer, do not add any other information.\n"
     "If the question is not in the context, say 'Your question is out of"
@@ -48,6 +55,7 @@ PROMPT_TEMPLATE = (
 )
 
 
+@functools.lru_cache(maxsize=1)
 def initialize_llama(
     model_path: str,
     n_ctx: int = 4096,
@@ -55,6 +63,9 @@ def initialize_llama(
 ) -> llama_cpp.Llama:
     """Initialize the Llama model.
 
+    The model is loaded once and cached, so repeated queries in the same
+    process skip the multi-second model load.
+
     Parameters:
     ----------
         - model_path (str): Path to the Llama model.
@@ -84,7 +95,7 @@ def format_prompt(context: str, question: str) -> str:
     -------
         - str: Formatted prompt string.
     """
-    return PROMPT_TEMPLATE.format(context=context, question=question)
+    return PROMPT_PREFIX + question + PROMPT_MIDDLE + context + PROMPT_SUFFIX
 
 
 def generate_response(llama_model, query: str, prompt_text: str):
@@ -102,9 +113,40 @@ def generate_response(llama_model, query: str, prompt_text: str):
         messages=[{"role": "user", "content": template}],
         stream=True,
     )
+    # Write tokens straight to the stdout buffer and flush periodically;
+    # a print() per token costs a lock + encode + potential flush each time
+    write = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+    tokens_written = 0
     for chunk in stream:
-        print(chunk["choices"][0]["delta"].get("content", ""), end="")
-    print("\n")
+        content = chunk["choices"][0]["delta"].get("content")
+        if not content:
+            continue
+        write(content.encode("utf-8"))
+        tokens_written += 1
+        if tokens_written % STREAM_FLUSH_INTERVAL == 0:
+            flush()
+    write(b"\n\n")
+    flush()
+
+
+@functools.lru_cache(maxsize=1)
+def get_chroma_db() -> Chroma:
+    """Get the Chroma database handle, creating it on first use.
+
+    The embedding model and the Chroma client are both expensive to set
+    up, so they are created once and reused across queries.
+
+    Returns:
+    -------
+        - Chroma: The Chroma database object.
+    """
+    embedding_function = get_embedding_function(str(EMBED_PATH))
+    return Chroma(
+        persist_directory=str(CHROMA_DB_PATH),
+        embedding_function=embedding_function,
+        collection_name=COLLECTION_NAME,
+    )
 
 
 def search_relevant_chunks(query_text: str) -> str:
@@ -118,15 +160,10 @@ def search_relevant_chunks(query_text: str) -> str:
     -------
         - str: Concatenated text of the relevant chunks.
     """
-    embedding_function = get_embedding_function(str(EMBED_PATH))
-    db = Chroma(
-        persist_directory=str(CHROMA_DB_PATH),
-        embedding_function=embedding_function,
-        collection_name=COLLECTION_NAME,
-    )
+    db = get_chroma_db()
     logger.info("Searching for relevant chunks for the query ...")
-    results = db.similarity_search_with_score(query_text, k=3)
-    logger.info(f"Found {len(results)} relevant chunks.")
+    results = db.similarity_search_with_score(query_text, k=similarity_k)
+    logger.info("Found %d relevant chunks.", len(results))
     return "\n\n---\n\n".join([doc.page_content for doc, _ in results])
 
 
@@ -137,7 +174,7 @@ def query_rag(query_text: str):
     ----------
         - query_text (str): Query text to search for.
     """
-    logger.info(f"Querying RAG with the question: {query_text}")
+    logger.info("Querying RAG with the question: %s", query_text)
     context_text = search_relevant_chunks(query_text)
     llama_model = initialize_llama(MODEL_PATH)
     generate_response(llama_model, query_text, context_text)
@@ -158,4 +195,5 @@ def command_line_interface():
 
 
 if __name__ == "__main__":
+    setup_logging()
     command_line_interface()